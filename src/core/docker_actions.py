@@ -1,36 +1,144 @@
+import functools
+import http.client
+import json
+import os
+import socket
 import subprocess
-from typing import List, Dict, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Dict, Optional, Set, Tuple, TypeVar
+from urllib.parse import quote
+
+DOCKER_SOCKET = "/var/run/docker.sock"
+
+
+class _UnixSocketHTTP(http.client.HTTPConnection):
+    """Keep-alive HTTP connection to the Docker daemon over its unix socket."""
+
+    def __init__(self, path: str = DOCKER_SOCKET, timeout: float = 60.0) -> None:
+        super().__init__("localhost", timeout=timeout)
+        self._path = path
+
+    def connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self._path)
+        self.sock = sock
+
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def _invalidates_cache(method: _F) -> _F:
+    """Drop the listing cache once the wrapped container action has finished.
+
+    Clearing afterwards (not before) also discards any listing taken while
+    the action was still running.
+    """
+    @functools.wraps(method)
+    def wrapper(self: "DockerManager", *args: Any, **kwargs: Any) -> Any:
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.invalidate()
+    return wrapper  # type: ignore[return-value]
 
 
 class DockerManager:
-    def __init__(self) -> None:
+    def __init__(self, cache_ttl: float = 0.5) -> None:
         self._client = None
+        # all_containers -> (fetched_at, containers)
+        self._cache: Dict[bool, Tuple[float, List[Dict[str, str]]]] = {}
+        self._ttl = cache_ttl
         try:
             import docker  # type: ignore
 
             self._client = docker.from_env()
         except Exception:
             self._client = None
+        # Without the SDK, talk to the daemon socket directly rather than
+        # forking the docker CLI for every call
+        self._api: Optional[_UnixSocketHTTP] = None
+        self._api_lock = threading.Lock()
+        if self._client is None and os.path.exists(DOCKER_SOCKET):
+            self._api = _UnixSocketHTTP()
 
     def _cli(self, args: List[str]) -> str:
         result = subprocess.check_output(["docker", *args], stderr=subprocess.STDOUT)
         return result.decode().strip()
 
+    def _api_call(self, method: str, path: str) -> Any:
+        assert self._api is not None
+        with self._api_lock:
+            try:
+                self._api.request(method, path)
+                resp = self._api.getresponse()
+                body = resp.read()
+            except Exception:
+                self._api.close()
+                raise
+        data = json.loads(body) if body else None
+        if resp.status >= 400:
+            message = data.get("message") if isinstance(data, dict) else None
+            raise RuntimeError(message or f"Docker API error {resp.status}")
+        return data
+
+    def _api_verb(self, verb: str, ident: str) -> bool:
+        """POST /containers/{ident}/{verb}; False if the socket is unusable.
+
+        A reply from the daemon rejecting the call (e.g. no such container)
+        raises RuntimeError with its message instead, since retrying the same
+        request through the CLI would only fail again.
+        """
+        if self._api is None:
+            return False
+        try:
+            self._api_call("POST", f"/containers/{quote(ident, safe='')}/{verb}")
+            return True
+        except (OSError, http.client.HTTPException):
+            return False
+
+    def invalidate(self) -> None:
+        self._cache.clear()
+
     def list_containers(self, all_containers: bool = True) -> List[Dict[str, str]]:
-        containers: List[Dict[str, str]] = []
+        cached = self._cache.get(all_containers)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < self._ttl:
+            return cached[1]
+        containers = self._fetch_containers(all_containers)
+        self._cache[all_containers] = (now, containers)
+        return containers
+
+    @staticmethod
+    def _from_api(c: Dict[str, Any]) -> Dict[str, str]:
+        ident = c.get("Id", "")[:12]
+        names = c.get("Names") or []
+        return {
+            "id": ident,
+            "name": names[0].lstrip("/") if names else ident,
+            "status": c.get("State", "unknown"),
+            "image": c.get("Image") or "<none>",
+        }
+
+    def _fetch_containers(self, all_containers: bool) -> List[Dict[str, str]]:
         if self._client is not None:
             try:
-                for c in self._client.containers.list(all=all_containers):  # type: ignore[attr-defined]
-                    containers.append({
-                        "id": c.short_id,
-                        "name": c.name,
-                        "status": getattr(c, "status", "unknown"),
-                        "image": getattr(c.image, "tags", ["<none>"])[0] if getattr(c, "image", None) else "<none>",
-                    })
-                return containers
+                # Low-level API returns one pre-populated dict per container; the
+                # high-level models would fetch /images/{id}/json per container.
+                raw = self._client.api.containers(all=all_containers)  # type: ignore[attr-defined]
+                return [self._from_api(c) for c in raw]
+            except Exception:
+                pass
+        if self._api is not None:
+            try:
+                raw = self._api_call("GET", f"/containers/json?all={1 if all_containers else 0}")
+                return [self._from_api(c) for c in raw]
             except Exception:
                 pass
         # CLI fallback
+        containers: List[Dict[str, str]] = []
         fmt = "{{.ID}}\t{{.Names}}\t{{.Status}}\t{{.Image}}"
         output = self._cli(["ps", "-a" if all_containers else "", "--format", fmt])
         for line in [ln for ln in output.split("\n") if ln.strip()]:
@@ -44,6 +152,7 @@ class DockerManager:
                 })
         return containers
 
+    @_invalidates_cache
     def start(self, ident: str) -> str:
         if self._client is not None:
             try:
@@ -52,9 +161,12 @@ class DockerManager:
                 return f"Started {c.name}"
             except Exception:
                 pass
+        if self._api_verb("start", ident):
+            return f"Started {ident}"
         self._cli(["start", ident])
         return f"Started {ident}"
 
+    @_invalidates_cache
     def stop(self, ident: str) -> str:
         if self._client is not None:
             try:
@@ -63,9 +175,12 @@ class DockerManager:
                 return f"Stopped {c.name}"
             except Exception:
                 pass
+        if self._api_verb("stop", ident):
+            return f"Stopped {ident}"
         self._cli(["stop", ident])
         return f"Stopped {ident}"
 
+    @_invalidates_cache
     def restart(self, ident: str) -> str:
         if self._client is not None:
             try:
@@ -74,5 +189,63 @@ class DockerManager:
                 return f"Restarted {c.name}"
             except Exception:
                 pass
+        if self._api_verb("restart", ident):
+            return f"Restarted {ident}"
         self._cli(["restart", ident])
         return f"Restarted {ident}"
+
+    @_invalidates_cache
+    def batch_action(self, idents: List[str], verb: str) -> str:
+        """Apply verb ('start' | 'stop' | 'restart') to several containers.
+
+        The SDK path fans out over a small thread pool, the socket path reuses
+        one daemon connection, and the CLI fallback issues a single
+        `docker <verb> id1 ... idN` so process startup is paid once.
+        """
+        if not idents:
+            return "No containers"
+        past = {"start": "Started", "stop": "Stopped", "restart": "Restarted"}[verb]
+        # Containers still to act on; a fallback only ever retries these so
+        # a partial failure never applies the verb twice
+        remaining = list(idents)
+        if self._client is not None:
+            client = self._client
+            done: Set[str] = set()
+
+            def apply(ident: str) -> None:
+                c = client.containers.get(ident)  # type: ignore[attr-defined]
+                getattr(c, verb)()
+                done.add(ident)
+            try:
+                # stop/restart block for the container's grace period, so run
+                # them concurrently over the SDK's connection pool
+                with ThreadPoolExecutor(max_workers=min(8, len(idents))) as ex:
+                    list(ex.map(apply, idents))
+                return f"{past} {len(idents)} containers"
+            except Exception:
+                # Leaving the with-block waited for every job, so done is final
+                remaining = [ident for ident in idents if ident not in done]
+        errors: List[str] = []
+        if self._api is not None:
+            unreachable: List[str] = []
+            for ident in remaining:
+                try:
+                    if not self._api_verb(verb, ident):
+                        unreachable.append(ident)
+                except RuntimeError as e:
+                    errors.append(f"{ident}: {e}")
+            remaining = unreachable
+        if remaining:
+            self._cli([verb, *remaining])
+        if errors:
+            raise RuntimeError(f"{len(errors)} failed, {errors[0]}")
+        return f"{past} {len(idents)} containers"
+
+    def batch_start(self, idents: List[str]) -> str:
+        return self.batch_action(idents, "start")
+
+    def batch_stop(self, idents: List[str]) -> str:
+        return self.batch_action(idents, "stop")
+
+    def batch_restart(self, idents: List[str]) -> str:
+        return self.batch_action(idents, "restart")
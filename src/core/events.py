@@ -17,11 +17,27 @@ class Button(Event):
     name: str  # 'confirm' | 'back' | 'push'
 
 
+@dataclass
+class ButtonEdge(Event):
+    name: str  # 'confirm' | 'back' | 'push'
+    pressed: bool  # raw level, before invert/merge
+
+
 @dataclass
 class Tick(Event):
     pass
 
 
+@dataclass
+class GameTick(Event):
+    pass
+
+
+@dataclass
+class HoldExpired(Event):
+    pass
+
+
 @dataclass
 class TaskDone(Event):
     ok: bool
@@ -1,52 +1,107 @@
+import functools
+import platform
+import shutil
+import socket
 import subprocess
 import time
-from typing import Tuple
+from typing import Callable, Dict, List, Tuple
 
 
+def _ttl_cache(seconds: float) -> Callable[[Callable[[], str]], Callable[[], str]]:
+    """Cache a no-argument reader's result for a few seconds."""
+    def decorator(func: Callable[[], str]) -> Callable[[], str]:
+        state: Dict[str, Tuple[float, str]] = {}
+
+        @functools.wraps(func)
+        def wrapper() -> str:
+            now = time.monotonic()
+            hit = state.get("v")
+            if hit is not None and now - hit[0] < seconds:
+                return hit[1]
+            value = func()
+            state["v"] = (now, value)
+            return value
+        return wrapper
+    return decorator
+
+
+def _human(num: float) -> str:
+    """Format a byte count like `df -h` (1024-based, K/M/G/T)."""
+    for unit in ("B", "K", "M", "G", "T"):
+        if num < 1024 or unit == "T":
+            break
+        num /= 1024.0
+    return f"{num:.1f}{unit}" if num < 10 else f"{num:.0f}{unit}"
+
+
+@_ttl_cache(2.0)
 def get_hostname_kernel() -> str:
-    hostname = subprocess.check_output(["hostname"]).decode().strip()
-    kernel = subprocess.check_output(["uname", "-r"]).decode().strip()
-    return f"Host: {hostname}\nKernel: {kernel}"
+    return f"Host: {socket.gethostname()}\nKernel: {platform.release()}"
 
 
+@_ttl_cache(2.0)
 def get_ip() -> str:
-    ip = subprocess.check_output(["hostname", "-I"]).decode().strip().split()[0]
+    try:
+        # UDP connect only selects the outbound interface; nothing is sent
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.connect(("10.255.255.255", 1))
+            ip = s.getsockname()[0]
+    except Exception:
+        ip = subprocess.check_output(["hostname", "-I"]).decode().strip().split()[0]
     return f"IP Address:\n{ip}"
 
 
+@_ttl_cache(2.0)
 def get_cpu_temp() -> str:
     try:
-        temp = subprocess.check_output(["vcgencmd", "measure_temp"]).decode().strip()
-        return f"CPU Temp:\n{temp}"
-    except Exception:
-        # Fallback using thermal zone
         with open("/sys/class/thermal/thermal_zone0/temp", "r") as f:
             milli = int(f.read().strip())
         return f"CPU Temp:\n{milli/1000.0:.1f} C"
+    except Exception:
+        temp = subprocess.check_output(["vcgencmd", "measure_temp"]).decode().strip()
+        return f"CPU Temp:\n{temp}"
 
 
+@_ttl_cache(2.0)
 def get_disk_usage() -> str:
-    df = subprocess.check_output(["df", "-h", "/"]).decode().split("\n")[1]
-    parts = df.split()
-    return f"Disk:\nUsed: {parts[2]}\nFree: {parts[3]}\n{parts[4]} used"
+    usage = shutil.disk_usage("/")
+    # Same percentage as df: used / (used + available), rounded up
+    pct = -(-usage.used * 100 // (usage.used + usage.free)) if usage.used + usage.free else 0
+    return f"Disk:\nUsed: {_human(usage.used)}\nFree: {_human(usage.free)}\n{pct}% used"
 
 
+@_ttl_cache(2.0)
 def get_memory_info() -> str:
-    mem = subprocess.check_output(["free", "-h"]).decode().split("\n")[1]
-    parts = mem.split()
-    return f"Memory:\nTotal: {parts[1]}\nUsed: {parts[2]}\nFree: {parts[3]}"
+    info: Dict[str, int] = {}
+    with open("/proc/meminfo", "r") as f:
+        for line in f:
+            key, _, rest = line.partition(":")
+            info[key] = int(rest.split()[0]) * 1024
+    total = info["MemTotal"]
+    used = total - info.get("MemAvailable", info["MemFree"])
+    return f"Memory:\nTotal: {_human(total)}\nUsed: {_human(used)}\nFree: {_human(info['MemFree'])}"
+
+
+def _run_and_capture(cmd: List[str]) -> Tuple[bool, str]:
+    """Run cmd without a TTY; return (ok, last line of output)."""
+    proc = subprocess.run(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    lines = [ln for ln in proc.stdout.decode(errors="replace").splitlines() if ln.strip()]
+    return proc.returncode == 0, (lines[-1] if lines else "")
 
 
 def apt_update() -> str:
-    subprocess.run(["sudo", "apt-get", "update"], check=True)
+    # sudo -n fails fast instead of waiting on a password prompt nobody sees
+    ok, last = _run_and_capture(["sudo", "-n", "apt-get", "update"])
+    if not ok:
+        raise RuntimeError(last or "apt-get update failed")
     return "Update complete!"
 
 
 def reboot(countdown_sec: int = 3) -> None:
     time.sleep(countdown_sec)
-    subprocess.run(["sudo", "reboot"], check=True)
+    subprocess.run(["sudo", "-n", "reboot"], stdin=subprocess.DEVNULL, check=True)
 
 
 def shutdown(countdown_sec: int = 3) -> None:
     time.sleep(countdown_sec)
-    subprocess.run(["sudo", "shutdown", "-h", "now"], check=True)
+    subprocess.run(["sudo", "-n", "shutdown", "-h", "now"], stdin=subprocess.DEVNULL, check=True)
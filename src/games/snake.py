@@ -1,14 +1,11 @@
 import random
-from dataclasses import dataclass
-from typing import List, Tuple
+from collections import deque
+from typing import Deque, Set, Tuple
 
-from PIL import ImageDraw
+from PIL import Image, ImageDraw
 
-
-@dataclass
-class Point:
-    x: int
-    y: int
+# Grid cell as (x, y); tuples hash and compare in C.
+Point = Tuple[int, int]
 
 
 class SnakeGame:
@@ -16,12 +13,22 @@ class SnakeGame:
         self.cell_size = 8
         self.cols = width_px // self.cell_size
         self.rows = height_px // self.cell_size
+        self._all_cells = [(x, y) for y in range(self.rows) for x in range(self.cols)]
+        cs = self.cell_size
+        # Top-left pixel of each cell's inner block, plus prebuilt blocks so
+        # render pastes sprites instead of rasterising rectangles
+        self._origins = {(x, y): (x * cs + 1, y * cs + 1) for x, y in self._all_cells}
+        self._head_sprite = Image.new("1", (cs - 2, cs - 2), 1)
+        self._body_sprite = Image.new("1", (cs - 2, cs - 2), 0)
+        ImageDraw.Draw(self._body_sprite).rectangle((0, 0, cs - 3, cs - 3), outline=1)
         self.reset()
 
     def reset(self) -> None:
         midx = self.cols // 2
         midy = self.rows // 2
-        self.snake: List[Point] = [Point(midx, midy), Point(midx - 1, midy)]
+        self.snake: Deque[Point] = deque([(midx, midy), (midx - 1, midy)])
+        # Cells covered by the snake, kept in lock-step with self.snake
+        self._occupied: Set[Point] = set(self.snake)
         self.direction: Tuple[int, int] = (1, 0)  # Right
         self.spawn_food()
         self.game_over = False
@@ -30,11 +37,12 @@ class SnakeGame:
         self.speed_ticks = 5  # lower is faster
 
     def spawn_food(self) -> None:
-        while True:
-            p = Point(random.randint(0, self.cols - 1), random.randint(0, self.rows - 1))
-            if p not in self.snake:
-                self.food = p
-                return
+        free = [c for c in self._all_cells if c not in self._occupied]
+        if not free:
+            # Snake fills the board
+            self.game_over = True
+            return
+        self.food = random.choice(free)
 
     def change_direction_clockwise(self, clockwise: bool) -> None:
         dx, dy = self.direction
@@ -43,45 +51,39 @@ class SnakeGame:
         else:
             self.direction = (-dy, dx)
 
-    def update(self) -> None:
+    def update(self) -> bool:
+        """Advance one tick; True if the board changed and needs a redraw."""
         if self.game_over:
-            return
+            return False
         self._tick_counter += 1
         if self._tick_counter % self.speed_ticks != 0:
-            return
-        head = self.snake[0]
-        nx = (head.x + self.direction[0]) % self.cols
-        ny = (head.y + self.direction[1]) % self.rows
-        new_head = Point(nx, ny)
-        if new_head in self.snake:
+            return False
+        hx, hy = self.snake[0]
+        new_head = ((hx + self.direction[0]) % self.cols, (hy + self.direction[1]) % self.rows)
+        if new_head in self._occupied:
             self.game_over = True
-            return
-        self.snake.insert(0, new_head)
+            return True
+        self.snake.appendleft(new_head)
+        self._occupied.add(new_head)
         if new_head == self.food:
             self.score += 1
             if self.speed_ticks > 2 and self.score % 3 == 0:
                 self.speed_ticks -= 1
             self.spawn_food()
         else:
-            self.snake.pop()
+            self._occupied.discard(self.snake.pop())
+        return True
 
-    def render(self, image, draw: ImageDraw.ImageDraw) -> None:
-        # Draw grid elements
+    def render(self, image: Image.Image, draw: ImageDraw.ImageDraw) -> None:
+        origins = self._origins
+        body = self._body_sprite
         # Food
-        draw.rectangle(self._cell_rect(self.food), outline=255, fill=0)
+        image.paste(body, origins[self.food])
         # Snake
-        for idx, p in enumerate(self.snake):
-            rect = self._cell_rect(p)
-            if idx == 0:
-                draw.rectangle(rect, outline=255, fill=255)
-            else:
-                draw.rectangle(rect, outline=255, fill=0)
+        for p in self.snake:
+            image.paste(body, origins[p])
+        image.paste(self._head_sprite, origins[self.snake[0]])
         # Score
         draw.text((2, 2), f"Score: {self.score}", fill=255)
         if self.game_over:
             draw.text((32, 28), "GAME OVER", fill=255)
-
-    def _cell_rect(self, p: Point) -> Tuple[int, int, int, int]:
-        x1 = p.x * self.cell_size
-        y1 = p.y * self.cell_size
-        return (x1 + 1, y1 + 1, x1 + self.cell_size - 2, y1 + self.cell_size - 2)
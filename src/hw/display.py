@@ -1,5 +1,7 @@
+import functools
+import math
 import time
-from typing import List, Tuple
+from typing import List, Optional, Sequence, Tuple
 
 import board
 import busio
@@ -9,6 +11,29 @@ from PIL import Image, ImageDraw
 from src.utils.fonts import get_font
 from src.utils.text import wrap_text
 
+# Fonts are fixed for the life of the process
+_FONT = get_font(11, bold=False)
+_FONT_BOLD = get_font(11, bold=True)
+
+
+@functools.lru_cache(maxsize=64)
+def _wrap_cached(text: str, max_chars: int) -> Tuple[str, ...]:
+    # Spinner and status screens redraw the same message every frame
+    return tuple(wrap_text(text, max_chars))
+
+
+# Spinner dot offsets around its centre (12 dots, radius 8)
+_SPINNER_OFFSETS: List[Tuple[int, int]] = [
+    (int(8 * 0.9 * math.cos(i / 12.0 * 6.28318)), int(8 * 0.9 * math.sin(i / 12.0 * 6.28318)))
+    for i in range(12)
+]
+_SPINNER_POINTS: List[Tuple[int, int]] = [(112 + dx, 52 + dy) for dx, dy in _SPINNER_OFFSETS]
+# Per frame: (dim dots, highlighted dot), so each redraw is two point() calls
+_SPINNER_FRAMES: List[Tuple[List[Tuple[int, int]], Tuple[int, int]]] = [
+    ([p for i, p in enumerate(_SPINNER_POINTS) if i != active], _SPINNER_POINTS[active])
+    for active in range(12)
+]
+
 
 class OledDisplay:
     def __init__(self) -> None:
@@ -25,33 +50,68 @@ class OledDisplay:
         self._display = display
         self.width = display.width
         self.height = display.height
+        # SSD1306_I2C keeps a control byte followed by the page-packed frame;
+        # when it looks like that we fill it directly instead of image()
+        self._pages = self.height // 8
+        buffer = getattr(display, "buffer", None)
+        self._raw_buffer = (
+            buffer
+            if isinstance(buffer, bytearray) and len(buffer) == self._pages * self.width + 1
+            else None
+        )
+        # (labels, index, title) currently on screen, if it is a menu
+        self._menu_on_screen: Optional[Tuple[Tuple[str, ...], int, str]] = None
+        # One frame and draw context, cleared and reused by every draw
+        self._frame = self.new_image()
+        self._frame_draw = ImageDraw.Draw(self._frame)
+        self._frame_box = (0, 0, self.width, self.height)
 
     def clear(self) -> None:
+        self._menu_on_screen = None
         self._display.fill(0)
         self._display.show()
 
     def new_image(self) -> Image.Image:
         return Image.new("1", (self.width, self.height))
 
+    def begin_frame(self) -> Tuple[Image.Image, ImageDraw.ImageDraw]:
+        """Clear and return the shared frame; pass it to show_image() when done.
+
+        The frame is overwritten by the next draw, so don't keep it around.
+        """
+        self._frame_draw.rectangle(self._frame_box, fill=0)
+        return self._frame, self._frame_draw
+
     def show_image(self, image: Image.Image) -> None:
-        self._display.image(image)
+        self._menu_on_screen = None
+        if self._raw_buffer is not None and image.mode == "1" and image.size == (self.width, self.height):
+            # Rotating 270 degrees makes each row of bytes one display column,
+            # with the lowest pixel of every 8-row page in the LSB. Taking
+            # every Nth byte then yields the SSD1306 page-major layout.
+            cols = image.transpose(Image.Transpose.ROTATE_270).tobytes()
+            last = self._pages - 1
+            self._raw_buffer[1:] = b"".join(cols[last - p::self._pages] for p in range(self._pages))
+        else:
+            self._display.image(image)
         self._display.show()
 
     def draw_text(self, text: str, bold: bool = False) -> None:
-        image = self.new_image()
-        draw = ImageDraw.Draw(image)
-        font = get_font(11, bold=bold)
-        lines = wrap_text(text, max_chars=20)
+        image, draw = self.begin_frame()
+        font = _FONT_BOLD if bold else _FONT
+        lines = _wrap_cached(text, 20)
         y = 0
         for line in lines[:6]:
             draw.text((2, y), line, font=font, fill=255)
             y += 11
         self.show_image(image)
 
-    def draw_menu(self, items: List[str], selected_index: int, title: str = "") -> None:
-        image = self.new_image()
-        draw = ImageDraw.Draw(image)
-        font = get_font(11, bold=True)
+    def draw_menu(self, items: Sequence[str], selected_index: int, title: str = "") -> None:
+        key = (tuple(items), selected_index, title)
+        if key == self._menu_on_screen:
+            # Same menu already displayed; skip the I2C transfer
+            return
+        image, draw = self.begin_frame()
+        font = _FONT_BOLD
         visible_items = 5
         start_index = max(0, selected_index - 2)
         end_index = min(len(items), start_index + visible_items)
@@ -66,23 +126,19 @@ class OledDisplay:
                 draw.text((4, y + 1), f"  {items[i]}", font=font, fill=255)
             y += 13
         self.show_image(image)
+        self._menu_on_screen = key
 
     def draw_spinner(self, message: str, frame: int = 0) -> None:
-        image = self.new_image()
-        draw = ImageDraw.Draw(image)
-        font = get_font(11, bold=False)
+        image, draw = self.begin_frame()
+        font = _FONT
         # Draw message
-        lines = wrap_text(message, max_chars=20)
+        lines = _wrap_cached(message, 20)
         y = 0
         for line in lines[:5]:
             draw.text((2, y), line, font=font, fill=255)
             y += 11
         # Spinner bottom-right
-        cx, cy, r = 112, 52, 8
-        for i in range(12):
-            angle = (i / 12.0) * 6.28318
-            x = cx + int(r * 0.9 * __import__("math").cos(angle))
-            y2 = cy + int(r * 0.9 * __import__("math").sin(angle))
-            shade = 255 if (i == (frame % 12)) else 80
-            draw.point((x, y2), fill=shade)
+        dim, lit = _SPINNER_FRAMES[frame % 12]
+        draw.point(dim, fill=80)
+        draw.point(lit, fill=255)
         self.show_image(image)
@@ -1,6 +1,8 @@
+import os
+import selectors
 import threading
 import time
-from typing import Optional
+from typing import Callable, Optional
 
 try:
     from evdev import InputDevice, list_devices, ecodes
@@ -22,10 +24,18 @@ class EvdevConfirm:
         self._pressed: bool = False
         self._thread: Optional[threading.Thread] = None
         self._stop = False
+        self._listener: Optional[Callable[[bool], None]] = None
+        # Written by close() to wake the listener out of select()
+        self._wake_r: Optional[int] = None
+        self._wake_w: Optional[int] = None
+        # Held by close() while it signals the pipe; the listener takes it
+        # before closing the pipe so the write never hits a closed fd
+        self._close_lock = threading.Lock()
         if InputDevice is None or list_devices is None or ecodes is None:
             return
         self._device_path = self._find_device_path()
         if self._device_path:
+            self._wake_r, self._wake_w = os.pipe()
             self._start_thread()
 
     @property
@@ -35,13 +45,26 @@ class EvdevConfirm:
     def is_pressed(self) -> bool:
         return bool(self._pressed)
 
+    def set_listener(self, listener: Optional[Callable[[bool], None]]) -> None:
+        """Call listener(pressed) from the reader thread on every change."""
+        self._listener = listener
+
+    def _set_pressed(self, pressed: bool) -> None:
+        if pressed != self._pressed:
+            self._pressed = pressed
+            if self._listener is not None:
+                self._listener(pressed)
+
     def close(self) -> None:
-        self._stop = True
-        try:
-            if self._device is not None:
-                self._device.close()
-        except Exception:
-            pass
+        with self._close_lock:
+            if self._stop:
+                return
+            self._stop = True
+            try:
+                if self._wake_w is not None:
+                    os.write(self._wake_w, b"\0")
+            except Exception:
+                pass
 
     def _find_device_path(self) -> Optional[str]:
         try:
@@ -50,7 +73,8 @@ class EvdevConfirm:
                     dev = InputDevice(path)
                     caps = dev.capabilities().get(ecodes.EV_KEY, [])
                     if ecodes.KEY_POWER in caps:
-                        dev.close()
+                        # Keep it open for the listener thread
+                        self._device = dev
                         return path
                     dev.close()
                 except Exception:
@@ -63,27 +87,52 @@ class EvdevConfirm:
             return None
         return None
 
+    def _close_device(self) -> None:
+        try:
+            if self._device is not None:
+                self._device.close()
+        except Exception:
+            pass
+        self._device = None
+
     def _start_thread(self) -> None:
+        wake_r, wake_w = self._wake_r, self._wake_w
+        assert wake_r is not None and wake_w is not None
+
         def loop() -> None:
             while not self._stop:
-                try:
-                    self._device = InputDevice(self._device_path) if self._device_path else None
-                    if self._device is None:
+                if self._device is None:
+                    try:
+                        self._device = InputDevice(self._device_path)
+                    except Exception:
                         time.sleep(1.0)
                         continue
-                    for event in self._device.read_loop():
-                        if self._stop:
-                            break
-                        if event.type == ecodes.EV_KEY and event.code == ecodes.KEY_POWER:
-                            self._pressed = (event.value != 0)
+                try:
+                    with selectors.DefaultSelector() as sel:
+                        sel.register(self._device.fd, selectors.EVENT_READ)
+                        sel.register(wake_r, selectors.EVENT_READ)
+                        while not self._stop:
+                            for key, _ in sel.select():
+                                if key.fd == wake_r:
+                                    break
+                                for event in self._device.read():
+                                    if event.type == ecodes.EV_KEY and event.code == ecodes.KEY_POWER:
+                                        self._set_pressed(event.value != 0)
                 except Exception:
-                    time.sleep(1.0)
-                finally:
+                    # Device went away or read failed: reopen after a backoff
+                    self._close_device()
+                    self._set_pressed(False)
+                    if not self._stop:
+                        time.sleep(1.0)
+            self._close_device()
+            # _stop is only set inside close(), so once the lock is ours its
+            # wake-up write is done and no later write can happen
+            with self._close_lock:
+                self._wake_r = self._wake_w = None
+                for fd in (wake_r, wake_w):
                     try:
-                        if self._device is not None:
-                            self._device.close()
+                        os.close(fd)
                     except Exception:
                         pass
-                    self._device = None
         self._thread = threading.Thread(target=loop, daemon=True)
         self._thread.start()
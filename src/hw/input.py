@@ -1,5 +1,7 @@
 import atexit
-from typing import Dict, Tuple
+import mmap
+import os
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 try:
     import RPi.GPIO as GPIO
@@ -12,7 +14,62 @@ except Exception:
     EvdevConfirm = None  # type: ignore
 
 
+class GpioBank:
+    """Reads the level of GPIO 0-31 in one load from /dev/gpiomem.
+
+    BCM283x/BCM2711 expose all bank-0 levels in the GPLEV0 register, so a
+    single 32-bit read replaces one GPIO.input() call per pin.
+    """
+
+    _GPLEV0 = 0x34
+
+    def __init__(self) -> None:
+        fd = os.open("/dev/gpiomem", os.O_RDONLY | os.O_SYNC)
+        try:
+            self._mem = mmap.mmap(fd, 4096, mmap.MAP_SHARED, mmap.PROT_READ)
+        finally:
+            os.close(fd)
+        self._regs = memoryview(self._mem).cast("I")
+
+    def read(self) -> int:
+        return self._regs[self._GPLEV0 // 4]
+
+    def matches(self, pins: Iterable[int]) -> bool:
+        """True if the register agrees with RPi.GPIO for these pins."""
+        bits = self.read()
+        return all(pin < 32 and ((bits >> pin) & 1) == GPIO.input(pin) for pin in pins)
+
+
+_bank: Optional[GpioBank] = None
+_bank_failed = False
+
+
+def _shared_bank(pins: Iterable[int]) -> Optional[GpioBank]:
+    """Return the process-wide bank reader if it is usable for pins."""
+    global _bank, _bank_failed
+    if _bank is None and not _bank_failed:
+        try:
+            _bank = GpioBank()
+        except Exception:
+            # No /dev/gpiomem (e.g. Pi 5 / RP1); stay on per-pin reads
+            _bank_failed = True
+    if _bank is not None and _bank.matches(pins):
+        return _bank
+    return None
+
+
+# Bit positions in the mask returned by Inputs.read_bits()
+BIT_BACK = 1 << 0
+BIT_CONFIRM = 1 << 1
+BIT_PUSH = 1 << 2
+BUTTON_BITS: Dict[str, int] = {"back": BIT_BACK, "confirm": BIT_CONFIRM, "push": BIT_PUSH}
+
+
 class Inputs:
+    # One atexit hook closes every instance, however many are constructed
+    _live: List["Inputs"] = []
+    _atexit_registered = False
+
     def __init__(self, back_gpio: int, confirm_gpio: int, push_gpio: int, pull_up: bool = True) -> None:
         self._pull_up = pull_up
         GPIO.setmode(GPIO.BCM)
@@ -24,24 +81,91 @@ class Inputs:
         }
         for pin in self._pins.values():
             GPIO.setup(pin, GPIO.IN, pull_up_down=pud)
+        self._active_level = 0 if pull_up else 1
+        self._pin_bits: Tuple[Tuple[int, int], ...] = tuple(
+            (pin, BUTTON_BITS[name]) for name, pin in self._pins.items()
+        )
+        self._bank = _shared_bank(self._pins.values())
         self._evdev = EvdevConfirm() if EvdevConfirm is not None else None
-        atexit.register(self.close)
+        Inputs._live.append(self)
+        if not Inputs._atexit_registered:
+            atexit.register(Inputs._close_all)
+            Inputs._atexit_registered = True
 
-    def read_states(self) -> Dict[str, bool]:
-        states: Dict[str, bool] = {}
-        for name, pin in self._pins.items():
+    def _evdev_pressed(self) -> bool:
+        try:
+            return self._evdev is not None and self._evdev.available and self._evdev.is_pressed()
+        except Exception:
+            return False
+
+    def start_callbacks(self, on_change: Callable[[str, bool], None]) -> bool:
+        """Report on_change(name, pressed) from GPIO edge interrupts.
+
+        States are raw, as from read_states(), with evdev KEY_POWER ORed into
+        confirm. Returns False, leaving polling as the only path, if edge
+        detection is unavailable.
+        """
+        names = {pin: name for name, pin in self._pins.items()}
+
+        def level(pin: int) -> bool:
             val = GPIO.input(pin)
-            pressed = (val == GPIO.LOW) if self._pull_up else (val == GPIO.HIGH)
-            states[name] = pressed
-        # Fallback: if evdev gpio-keys present, OR it into confirm
+            return (val == GPIO.LOW) if self._pull_up else (val == GPIO.HIGH)
+
+        def edge(pin: int) -> None:
+            name = names[pin]
+            pressed = level(pin)
+            if name == "confirm":
+                pressed = pressed or self._evdev_pressed()
+            on_change(name, pressed)
+
         try:
-            if self._evdev is not None and self._evdev.available and self._evdev.is_pressed():
-                states["confirm"] = True
+            for pin in self._pins.values():
+                GPIO.add_event_detect(pin, GPIO.BOTH, callback=edge)
         except Exception:
-            pass
-        return states
+            for pin in self._pins.values():
+                try:
+                    GPIO.remove_event_detect(pin)
+                except Exception:
+                    pass
+            return False
+        if self._evdev is not None and self._evdev.available:
+            self._evdev.set_listener(
+                lambda pressed: on_change("confirm", pressed or level(self._pins["confirm"]))
+            )
+        return True
+
+    @classmethod
+    def _close_all(cls) -> None:
+        for inputs in list(cls._live):
+            inputs.close()
+
+    def read_states(self) -> Dict[str, bool]:
+        """read_bits() keyed by button name."""
+        bits = self.read_bits()
+        return {name: bool(bits & BUTTON_BITS[name]) for name in self._pins}
+
+    def read_bits(self) -> int:
+        """Pressed buttons as a BIT_* mask, evdev KEY_POWER ORed into confirm."""
+        bits = 0
+        if self._bank is not None:
+            levels = self._bank.read()
+            active = self._active_level
+            for pin, bit in self._pin_bits:
+                if ((levels >> pin) & 1) == active:
+                    bits |= bit
+        else:
+            pressed_level = GPIO.LOW if self._pull_up else GPIO.HIGH
+            for pin, bit in self._pin_bits:
+                if GPIO.input(pin) == pressed_level:
+                    bits |= bit
+        if self._evdev_pressed():
+            bits |= BIT_CONFIRM
+        return bits
 
     def close(self) -> None:
+        if self not in Inputs._live:
+            return
+        Inputs._live.remove(self)
         try:
             if self._evdev is not None:
                 self._evdev.close()
@@ -59,16 +183,14 @@ class EncoderPoller:
     Accumulates transitions and emits +/-1 per detent.
     """
 
-    _TRANSITIONS: Dict[Tuple[int, int], int] = {
-        (0, 1): +1,
-        (1, 3): +1,
-        (3, 2): +1,
-        (2, 0): +1,
-        (0, 2): -1,
-        (2, 3): -1,
-        (3, 1): -1,
-        (1, 0): -1,
-    }
+    # Step for each (prev << 2) | curr Gray-code transition; invalid or
+    # unchanged states map to 0
+    _TABLE: Tuple[int, ...] = (
+        0, +1, -1, 0,
+        -1, 0, 0, +1,
+        +1, 0, 0, -1,
+        0, -1, +1, 0,
+    )
 
     def __init__(self, a_gpio: int, b_gpio: int, pull_up: bool = True, ticks_per_detent: int = 4) -> None:
         self._a = a_gpio
@@ -83,26 +205,63 @@ class EncoderPoller:
             GPIO.setmode(GPIO.BCM)
         GPIO.setup(self._a, GPIO.IN, pull_up_down=pud)
         GPIO.setup(self._b, GPIO.IN, pull_up_down=pud)
+        self._bank = _shared_bank((self._a, self._b))
         self._last_state = self._read_state()
         self._accumulator = 0
 
+    def start_callbacks(self, on_step: Callable[[int], None]) -> bool:
+        """Decode on A/B edge interrupts and report each detent to on_step.
+
+        on_step runs on RPi.GPIO's callback thread. Returns False, leaving the
+        poller usable via read_delta(), if edge detection is unavailable.
+        Invalid Gray-code transitions decode to 0, which doubles as glitch
+        rejection, so no bouncetime is set.
+        """
+        def edge(_channel: int) -> None:
+            steps = self.read_delta()
+            if steps:
+                on_step(steps)
+        try:
+            GPIO.add_event_detect(self._a, GPIO.BOTH, callback=edge)
+            GPIO.add_event_detect(self._b, GPIO.BOTH, callback=edge)
+        except Exception:
+            for pin in (self._a, self._b):
+                try:
+                    GPIO.remove_event_detect(pin)
+                except Exception:
+                    pass
+            return False
+        return True
+
     def _read_state(self) -> int:
+        if self._bank is not None:
+            bits = self._bank.read()
+            return (((bits >> self._a) & 1) << 1) | ((bits >> self._b) & 1)
         a_bit = 1 if GPIO.input(self._a) else 0
         b_bit = 1 if GPIO.input(self._b) else 0
         return (a_bit << 1) | b_bit
 
+    def resync(self) -> None:
+        """Adopt the current A/B state after a pause in polling."""
+        self._last_state = self._read_state()
+        self._accumulator = 0
+
     def read_delta(self) -> int:
         """Return -n..+n steps since last call."""
         state = self._read_state()
         if state == self._last_state:
             return 0
-        delta = self._TRANSITIONS.get((self._last_state, state), 0)
+        delta = self._TABLE[(self._last_state << 2) | state]
         self._last_state = state
         if delta == 0:
             return 0
-        self._accumulator += delta
-        steps = 0
-        while abs(self._accumulator) >= self._ticks_per_detent:
-            steps += 1 if self._accumulator > 0 else -1
-            self._accumulator -= self._ticks_per_detent if self._accumulator > 0 else -self._ticks_per_detent
-        return steps
+        # At most one transition per call, so at most one detent completes
+        acc = self._accumulator + delta
+        if acc >= self._ticks_per_detent:
+            self._accumulator = acc - self._ticks_per_detent
+            return 1
+        if acc <= -self._ticks_per_detent:
+            self._accumulator = acc + self._ticks_per_detent
+            return -1
+        self._accumulator = acc
+        return 0
@@ -1,38 +1,46 @@
 import threading
 import time
 import os
-from queue import Queue
-from typing import Callable, List, Optional
+from queue import Empty, SimpleQueue
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
 
-from src.core.events import Button as ButtonEvent, Rotate, Tick, TaskDone, Event
+from src.core.events import Button as ButtonEvent, ButtonEdge, GameTick, HoldExpired, Rotate, Tick, TaskDone, Event
 from src.core.docker_actions import DockerManager
 from src.core import system_actions
 from src.games.snake import SnakeGame
 from src.hw.display import OledDisplay
-from src.hw.input import Inputs, EncoderPoller
+from src.hw.input import BIT_BACK, BIT_CONFIRM, BIT_PUSH, BUTTON_BITS, Inputs, EncoderPoller
 
 
-def _env_int(name: str, default: int) -> int:
+_TRUTHY = frozenset(("1", "true", "yes", "on"))
+_T = TypeVar("_T")
+
+
+def _env(name: str, default: _T, conv: Callable[[str], _T]) -> _T:
+    v = os.environ.get(name)
+    if not v:
+        return default
     try:
-        v = os.getenv(name)
-        return int(v) if v is not None and v != "" else default
-    except Exception:
+        return conv(v)
+    except ValueError:
+        # Malformed override; keep the built-in default
         return default
 
 
+def _to_bool(v: str) -> bool:
+    return v.strip().lower() in _TRUTHY
+
+
+def _env_int(name: str, default: int) -> int:
+    return _env(name, default, int)
+
+
 def _env_float(name: str, default: float) -> float:
-    try:
-        v = os.getenv(name)
-        return float(v) if v is not None and v != "" else default
-    except Exception:
-        return default
+    return _env(name, default, float)
 
 
 def _env_bool(name: str, default: bool) -> bool:
-    v = os.getenv(name)
-    if v is None or v == "":
-        return default
-    return v.strip().lower() in ("1", "true", "yes", "on")
+    return _env(name, default, _to_bool)
 
 
 BACK_GPIO = _env_int("BESSAM_BACK_GPIO", 17)
@@ -45,22 +53,59 @@ POLL_INTERVAL_SEC = _env_float("BESSAM_POLL_INTERVAL_SEC", 0.005)
 DEBOUNCE_SEC = _env_float("BESSAM_DEBOUNCE_SEC", 0.03)
 PULL_UP = _env_bool("BESSAM_PULL_UP", True)
 ENC_REVERSE = _env_bool("BESSAM_ENC_REVERSE", False)
+ENC_USE_EDGES = _env_bool("BESSAM_ENC_EDGES", True)
+BUTTON_USE_EDGES = _env_bool("BESSAM_BUTTON_EDGES", True)
+EXIT_HOLD_SEC = 2.0
 DEBUG = _env_bool("BESSAM_DEBUG", False)
 USE_PUSH_AS_CONFIRM = _env_bool("BESSAM_USE_PUSH_AS_CONFIRM", True)
 BACK_INVERT = _env_bool("BESSAM_BACK_INVERT", False)
 CONFIRM_INVERT = _env_bool("BESSAM_CONFIRM_INVERT", False)
 PUSH_INVERT = _env_bool("BESSAM_PUSH_INVERT", False)
+SPINNER_TICK_SEC = _env_float("BESSAM_SPINNER_TICK_SEC", 0.083)
+SNAKE_TICK_SEC = _env_float("BESSAM_SNAKE_TICK_SEC", 0.06)
+INPUT_TEST_TICK_SEC = 0.1
+# Invert flags as one XOR over the Inputs.read_bits() mask
+_INVERT_MASK = (BIT_BACK if BACK_INVERT else 0) | (BIT_CONFIRM if CONFIRM_INVERT else 0) | (BIT_PUSH if PUSH_INVERT else 0)
+# Debounced buttons by bit position (BIT_BACK, BIT_CONFIRM)
+_BUTTON_NAMES = ("back", "confirm")
+# Integer-nanosecond forms for the input hot path (time.monotonic_ns)
+POLL_INTERVAL_NS = int(POLL_INTERVAL_SEC * 1e9)
+DEBOUNCE_NS = int(DEBOUNCE_SEC * 1e9)
+EXIT_HOLD_NS = int(EXIT_HOLD_SEC * 1e9)
+SPINNER_TICK_NS = max(1, int(SPINNER_TICK_SEC * 1e9))
+DOCKER_CACHE_TTL_SEC = _env_float("BESSAM_DOCKER_CACHE_TTL_SEC", 2.0)
+
+# UI modes; plain ints so the per-event mode checks are int compares
+MODE_MENU, MODE_DOCKER_LIST, MODE_INPUT_TEST, MODE_GAME_SNAKE, MODE_PROGRESS = range(5)
+_MODE_NAMES = ("menu", "docker_list", "input_test", "game_snake", "progress")
 
 
 class BackgroundWorker:
-    def __init__(self, queue: Queue) -> None:
+    """Runs one task at a time on a long-lived thread, posting TaskDone."""
+
+    def __init__(self, queue: SimpleQueue) -> None:
         self._queue = queue
-        self._thread: Optional[threading.Thread] = None
+        self._jobs: SimpleQueue = SimpleQueue()
+        # Set from submission until the task's TaskDone has been posted, so
+        # at most one TaskDone is ever outstanding on the event queue
+        self._busy = threading.Event()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
 
-    def run(self, func: Callable[[], str]) -> None:
-        if self._thread and self._thread.is_alive():
-            return
-        def target() -> None:
+    def is_busy(self) -> bool:
+        return self._busy.is_set()
+
+    def run(self, func: Callable[[], str]) -> bool:
+        """Queue func for the worker thread; False if a task is still running."""
+        if self._busy.is_set():
+            return False
+        self._busy.set()
+        self._jobs.put(func)
+        return True
+
+    def _loop(self) -> None:
+        while True:
+            func = self._jobs.get()
             ok = True
             msg = None
             try:
@@ -68,54 +113,195 @@ class BackgroundWorker:
             except Exception as e:
                 ok = False
                 msg = str(e)
-            self._queue.put(TaskDone(type="task_done", ok=ok, message=msg))
-        self._thread = threading.Thread(target=target, daemon=True)
+            finally:
+                try:
+                    self._queue.put(TaskDone(type="task_done", ok=ok, message=msg))
+                finally:
+                    self._busy.clear()
+
+
+class Ticker:
+    """Posts timer events at a fixed interval while a mode needs animation.
+
+    One long-lived thread; at most one event is outstanding so a slow frame
+    never builds a backlog.
+    """
+
+    def __init__(self, queue: SimpleQueue, make_event: Callable[[], Event] = lambda: Tick(type="tick")) -> None:
+        self._queue = queue
+        self._make_event = make_event
+        self._interval: Optional[float] = None
+        # Next firing time (monotonic); advanced by whole intervals so
+        # handling time and wakeup latency don't accumulate as drift
+        self._deadline = 0.0
+        self._pending = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
         self._thread.start()
 
+    def start(self, interval: float) -> None:
+        with self._cond:
+            self._interval = interval
+            self._deadline = time.monotonic() + interval
+            self._cond.notify()
+
+    def stop(self) -> None:
+        with self._cond:
+            self._interval = None
+            self._cond.notify()
+
+    def consumed(self) -> None:
+        self._pending = False
+
+    def _loop(self) -> None:
+        with self._cond:
+            while True:
+                if self._interval is None:
+                    self._cond.wait()
+                    continue
+                now = time.monotonic()
+                if now < self._deadline:
+                    # Re-checked after a timeout or a start/stop notify
+                    self._cond.wait(timeout=self._deadline - now)
+                    continue
+                self._deadline += self._interval
+                if self._deadline <= now:
+                    # A whole period was missed; resume the grid from now
+                    # rather than firing a burst to catch up
+                    self._deadline = now + self._interval
+                if not self._pending:
+                    self._pending = True
+                    self._queue.put(self._make_event())
+
 
 class App:
     def __init__(self) -> None:
-        self.events: Queue[Event] = Queue()
+        self.events: SimpleQueue[Event] = SimpleQueue()
         self.display = OledDisplay()
-        self.docker = DockerManager()
+        self.docker = DockerManager(cache_ttl=DOCKER_CACHE_TTL_SEC)
         self.worker = BackgroundWorker(self.events)
+        self.ticker = Ticker(self.events)
+        # Snake steps at its own tempo, independent of the UI animation tick
+        self.game_ticker = Ticker(self.events, lambda: GameTick(type="game_tick"))
         self.inputs = Inputs(BACK_GPIO, CONFIRM_GPIO, PUSH_GPIO, pull_up=PULL_UP)
         self.encoder = EncoderPoller(ENC_A_GPIO, ENC_B_GPIO, pull_up=PULL_UP, ticks_per_detent=ENC_TICKS_PER_DETENT)
+        # Edge callbacks post Rotate events; otherwise the encoder is polled
+        self._use_native_encoder = ENC_USE_EDGES and self.encoder.start_callbacks(
+            lambda delta: self.events.put(Rotate(type="rotate", delta=delta))
+        )
+        # Likewise buttons post raw edges; polling stays as the fallback
+        self._use_native_buttons = BUTTON_USE_EDGES and self.inputs.start_callbacks(
+            lambda name, pressed: self.events.put(ButtonEdge(type="button_edge", name=name, pressed=pressed))
+        )
+        self._raw_bits = self.inputs.read_bits()
         # State
-        self.mode: str = "menu"
+        self.mode: int = MODE_MENU
+        # Rotation handler for the current mode, rebound on every mode change
+        self._rotate_handler: Callable[[int], None] = self._rotate_menu
         self.spinner_frame = 0
-        self.menu_stack: List[tuple[str, List[tuple[str, Callable[[], None]]], int]] = []
+        self._spinner_start_ns = 0
+        self.menu_stack: List[tuple[str, List[tuple[str, Callable[[], None]]], Tuple[str, ...], int]] = []
         self.current_menu_items: List[tuple[str, Callable[[], None]]] = []
+        # Labels of current_menu_items, built once per menu rather than per redraw
+        self.current_menu_labels: Tuple[str, ...] = ()
+        self._docker_list: List[Dict[str, str]] = []
+        self._docker_labels: Tuple[str, ...] = ()
         self.current_index = 0
         self.current_container_id: Optional[str] = None
         self.game: Optional[SnakeGame] = None
+        self._encoder_paused = False
         # Button debouncing
-        self._btn_state = {"back": False, "confirm": False, "push": False}
-        self._btn_last_change = {"back": 0.0, "confirm": 0.0, "push": 0.0}
+        # Debounced BIT_BACK | BIT_CONFIRM state, and when each bit last
+        # changed (monotonic ns), indexed by bit position
+        self._btn_bits = 0
+        self._btn_changed_ns = [0, 0]
+        # Back+Confirm exit hold: one-shot timer armed while both are down
+        self._hold_start_ns: Optional[int] = None
+        self._hold_timer: Optional[threading.Timer] = None
+        # Set by exit_app / the exit hold; run() stops at the next iteration
+        self._should_exit = False
         # Diagnostics
         self._input_test_enc_total = 0
-        self._input_test_last_draw = 0.0
+        # Latest frame requested since the last flush; drawn once per batch
+        self._pending_render: Optional[Tuple[Callable[..., None], tuple]] = None
+        # Detents not yet applied; a burst of them moves the cursor once
+        self._pending_delta = 0
+        # Event type -> handler; one dict lookup per event in run()
+        self._dispatch: Dict[type, Callable[[Any], None]] = {
+            ButtonEvent: self._on_button,
+            ButtonEdge: self._on_button_edge,
+            Rotate: self._on_rotate,
+            Tick: self._on_tick,
+            GameTick: self._on_game_tick,
+            TaskDone: self._on_task_done,
+            HoldExpired: self._on_hold_expired,
+        }
         # Init UI
         self._init_menus()
-        self.display.draw_text("Pi Control\nSystem v2.0\n\nInitializing...")
+        # MODE_* -> button name -> action; unlisted pairs (progress, game
+        # confirm) are ignored. Built after _init_menus, which binds pop_menu.
+        self._button_dispatch: Dict[int, Dict[str, Callable[[], None]]] = {
+            MODE_MENU: {"confirm": self._menu_confirm, "back": self.pop_menu},
+            MODE_DOCKER_LIST: {"confirm": self._docker_confirm, "back": self._show_menu},
+            MODE_INPUT_TEST: {"back": self._show_menu},
+            MODE_GAME_SNAKE: {"back": self._leave_game},
+        }
+        self._draw_now("Pi Control\nSystem v2.0\n\nInitializing...")
         time.sleep(1.0)
         self._show_menu()
 
+    def _schedule_tick(self, interval: float) -> None:
+        self.ticker.start(interval)
+
+    def _cancel_tick(self) -> None:
+        self.ticker.stop()
+        self.game_ticker.stop()
+
+    def _request(self, draw: Callable[..., None], *args: Any) -> None:
+        # Only the last request before a flush matters; it replaces the screen
+        self._pending_render = (draw, args)
+
+    def _request_draw_text(self, text: str) -> None:
+        self._request(self.display.draw_text, text)
+
+    def _request_draw_menu(self, labels: Sequence[str], index: int) -> None:
+        self._request(self.display.draw_menu, labels, index)
+
+    def _request_spinner(self, message: str, frame: int) -> None:
+        self._request(self.display.draw_spinner, message, frame)
+
+    def _request_game(self) -> None:
+        self._request(self._render_game)
+
+    def _flush_display(self) -> None:
+        pending = self._pending_render
+        if pending is not None:
+            self._pending_render = None
+            draw, args = pending
+            draw(*args)
+
+    def _draw_now(self, text: str) -> None:
+        """Draw immediately, for screens shown before a blocking sleep."""
+        self._pending_render = None
+        self.display.draw_text(text)
+
     def _debug(self, msg: str) -> None:
         if DEBUG:
             print(msg, flush=True)
 
     def _init_menus(self) -> None:
         def push_menu(title: str, items: List[tuple[str, Callable[[], None]]]) -> None:
-            self.menu_stack.append((title, self.current_menu_items, self.current_index))
+            self.menu_stack.append((title, self.current_menu_items, self.current_menu_labels, self.current_index))
             self.current_menu_items = items
+            self.current_menu_labels = tuple(name for name, _ in items)
             self.current_index = 0
             self._show_menu()
 
         def pop_menu() -> None:
             if self.menu_stack:
-                title, items, idx = self.menu_stack.pop()
+                title, items, labels, idx = self.menu_stack.pop()
                 self.current_menu_items = items
+                self.current_menu_labels = labels
                 self.current_index = idx
                 self._show_menu()
 
@@ -129,31 +315,30 @@ class App:
             self._start_progress(lambda: (system_actions.shutdown() or "Shutting down..."), "Shutting down in 3s...")
 
         def show_info() -> None:
-            self.display.draw_text(system_actions.get_hostname_kernel())
+            self._request_draw_text(system_actions.get_hostname_kernel())
 
         def show_ip() -> None:
-            self.display.draw_text(system_actions.get_ip())
+            self._request_draw_text(system_actions.get_ip())
 
         def show_cpu() -> None:
-            self.display.draw_text(system_actions.get_cpu_temp())
+            self._request_draw_text(system_actions.get_cpu_temp())
 
         def show_disk() -> None:
-            self.display.draw_text(system_actions.get_disk_usage())
+            self._request_draw_text(system_actions.get_disk_usage())
 
         def show_mem() -> None:
-            self.display.draw_text(system_actions.get_memory_info())
+            self._request_draw_text(system_actions.get_memory_info())
 
         def do_update() -> None:
             self._start_progress(system_actions.apt_update, "Updating... This may take a while")
 
         def exit_app() -> None:
-            self.display.draw_text("Goodbye!")
+            self._draw_now("Goodbye!")
             time.sleep(0.8)
             self.display.clear()
-            raise SystemExit(0)
+            self._should_exit = True
 
         def docker_menu() -> None:
-            self.mode = "docker_list"
             self._refresh_docker_list()
 
         def games_menu() -> None:
@@ -163,10 +348,11 @@ class App:
             self.push_menu("Games", items)
 
         def input_test() -> None:
-            self.mode = "input_test"
+            self.mode = MODE_INPUT_TEST
+            self._rotate_handler = self._rotate_input_test
             self._input_test_enc_total = 0
-            self._input_test_last_draw = 0.0
-            self._render_input_test(force=True)
+            self._render_input_test()
+            self._schedule_tick(INPUT_TEST_TICK_SEC)
 
         items: List[tuple[str, Callable[[], None]]] = [
             ("Docker", docker_menu),
@@ -183,31 +369,53 @@ class App:
             ("Exit", exit_app),
         ]
         self.current_menu_items = items
+        self.current_menu_labels = tuple(name for name, _ in items)
         self.current_index = 0
 
     def _show_menu(self) -> None:
-        self.mode = "menu"
-        labels = [name for name, _ in self.current_menu_items]
-        self.display.draw_menu(labels, self.current_index)
+        self.mode = MODE_MENU
+        self._rotate_handler = self._rotate_menu
+        self._cancel_tick()
+        self._request_draw_menu(self.current_menu_labels, self.current_index)
 
     def _start_progress(self, func: Callable[[], str], message: str) -> None:
-        self.mode = "progress"
+        if self.worker.is_busy():
+            # Entering progress mode now would wait on a TaskDone that
+            # belongs to the previous task
+            self._draw_now("Busy")
+            time.sleep(0.5)
+            self._show_menu()
+            return
+        self.mode = MODE_PROGRESS
+        self._rotate_handler = self._rotate_ignore
         self._progress_message = message
         self.spinner_frame = 0
+        self._spinner_start_ns = time.monotonic_ns()
         self.worker.run(func)
-        self.display.draw_spinner(message, self.spinner_frame)
+        self._request_spinner(message, self.spinner_frame)
+        self._schedule_tick(SPINNER_TICK_SEC)
 
     def _refresh_docker_list(self) -> None:
-        self.mode = "docker_list"
+        self.mode = MODE_DOCKER_LIST
+        self._rotate_handler = self._rotate_docker
+        self._cancel_tick()
         try:
-            containers = self.docker.list_containers(all_containers=True)
-            self._docker_list = containers
-            labels = [f"{c['name']} [{c['status']}]" for c in containers]
-            if not labels:
-                labels = ["<no containers>"]
-            self.display.draw_menu(labels, self.current_index)
+            self._fetch_docker_list()
         except Exception as e:
-            self.display.draw_text(f"Docker error:\n{str(e)[:20]}")
+            self._request_draw_text(f"Docker error:\n{str(e)[:20]}")
+            return
+        self._redraw_docker_list()
+
+    def _fetch_docker_list(self) -> None:
+        """Query the daemon (or its listing cache) and update the labels."""
+        containers = self.docker.list_containers(all_containers=True)
+        if containers is not self._docker_list:
+            # New listing (not a cache hit): format its labels once
+            self._docker_list = containers
+            self._docker_labels = tuple(f"{c['name']} [{c['status']}]" for c in containers) or ("<no containers>",)
+
+    def _redraw_docker_list(self) -> None:
+        self._request_draw_menu(self._docker_labels, self.current_index)
 
     def _open_container_actions(self, idx: int) -> None:
         if not hasattr(self, "_docker_list") or not self._docker_list:
@@ -228,169 +436,270 @@ class App:
         self.push_menu(f"{name}", items)
 
     def _start_snake(self) -> None:
-        self.mode = "game_snake"
+        self.mode = MODE_GAME_SNAKE
+        self._rotate_handler = self._rotate_game
         self.game = SnakeGame(self.display.width, self.display.height)
-        self._render_game()
+        self._request_game()
+        self.game_ticker.start(SNAKE_TICK_SEC)
 
     def _render_game(self) -> None:
         if not self.game:
             return
-        image = self.display.new_image()
-        draw = __import__("PIL").ImageDraw.Draw(image)
+        image, draw = self.display.begin_frame()
         self.game.render(image, draw)
         self.display.show_image(image)
 
-    def _render_input_test(self, force: bool = False) -> None:
-        now = time.monotonic()
-        if not force and now - self._input_test_last_draw < 0.1:
-            return
-        self._input_test_last_draw = now
-        raw = self.inputs.read_states()
-        # Apply invert flags for display
-        back = raw.get("back", False)
-        conf = raw.get("confirm", False)
-        push = raw.get("push", False)
-        if BACK_INVERT:
-            back = not back
-        if CONFIRM_INVERT:
-            conf = not conf
-        if PUSH_INVERT:
-            push = not push
+    def _render_input_test(self) -> None:
+        # Paced by the INPUT_TEST_TICK_SEC ticker; rotations coalesce per burst
+        # Invert flags applied, push shown on its own (not merged into confirm)
+        bits = self.inputs.read_bits() ^ _INVERT_MASK
         text = (
-            f"Back:{'1' if back else '0'} Conf:{'1' if conf else '0'}\n"
-            f"Push:{'1' if push else '0'} Enc:{self._input_test_enc_total}"
+            f"Back:{'1' if bits & BIT_BACK else '0'} Conf:{'1' if bits & BIT_CONFIRM else '0'}\n"
+            f"Push:{'1' if bits & BIT_PUSH else '0'} Enc:{self._input_test_enc_total}"
         )
-        self.display.draw_text(text)
+        self._request_draw_text(text)
 
     def _handle_button(self, name: str) -> None:
-        self._debug(f"button:{name}")
-        if self.mode == "menu":
-            if name == "confirm" and self.current_menu_items:
-                _, action = self.current_menu_items[self.current_index]
-                action()
-            elif name == "back":
-                self.pop_menu()
-        elif self.mode == "docker_list":
-            if name == "confirm" and hasattr(self, "_docker_list") and self._docker_list:
-                self._open_container_actions(self.current_index)
-            elif name == "back":
-                self._show_menu()
-        elif self.mode == "input_test":
-            if name == "back":
-                self._show_menu()
-        elif self.mode == "game_snake":
-            if not self.game:
-                return
-            if name == "confirm":
-                pass
-            elif name == "back":
-                self._show_menu()
-                self.game = None
-        elif self.mode == "progress":
-            pass
+        self._debug(f"button:{name} mode:{_MODE_NAMES[self.mode]}")
+        # A press acts on the row the user scrolled to
+        self._apply_rotation()
+        handler = self._button_dispatch.get(self.mode, {}).get(name)
+        if handler is not None:
+            handler()
+
+    def _menu_confirm(self) -> None:
+        if self.current_menu_items:
+            _, action = self.current_menu_items[self.current_index]
+            action()
+
+    def _docker_confirm(self) -> None:
+        if self._docker_list:
+            self._open_container_actions(self.current_index)
+
+    def _leave_game(self) -> None:
+        if not self.game:
+            return
+        self._show_menu()
+        self.game = None
 
     def _handle_rotate(self, delta: int) -> None:
         if ENC_REVERSE:
             delta = -delta
         self._debug(f"enc:{delta}")
-        if self.mode in ("menu", "docker_list"):
-            items_len = len(self.current_menu_items) if self.mode == "menu" else len(getattr(self, "_docker_list", [])) or 1
-            if delta > 0:
-                self.current_index = (self.current_index + 1) % items_len
-            else:
-                self.current_index = (self.current_index - 1) % items_len
-            if self.mode == "menu":
-                labels = [name for name, _ in self.current_menu_items]
-                self.display.draw_menu(labels, self.current_index)
-            else:
-                self._refresh_docker_list()
-        elif self.mode == "input_test":
-            self._input_test_enc_total += delta
-            self._render_input_test(force=True)
-        elif self.mode == "game_snake" and self.game:
+        self._rotate_handler(delta)
+
+    # Per-mode rotation handlers; the mode setters bind one to _rotate_handler
+
+    def _rotate_ignore(self, delta: int) -> None:
+        pass
+
+    def _rotate_menu(self, delta: int) -> None:
+        index = (self.current_index + delta) % len(self.current_menu_items)
+        if index == self.current_index:
+            # Wrapped back to the same row (one-item menu, full turn)
+            return
+        self.current_index = index
+        self._request_draw_menu(self.current_menu_labels, self.current_index)
+
+    def _rotate_docker(self, delta: int) -> None:
+        index = (self.current_index + delta) % (len(self._docker_list) or 1)
+        if index == self.current_index:
+            return
+        self.current_index = index
+        # Scrolling only moves the cursor; no need to re-list containers
+        self._redraw_docker_list()
+
+    def _rotate_input_test(self, delta: int) -> None:
+        self._input_test_enc_total += delta
+        self._render_input_test()
+
+    def _rotate_game(self, delta: int) -> None:
+        if not self.game:
+            return
+        for _ in range(abs(delta) % 4):
             self.game.change_direction_clockwise(clockwise=(delta > 0))
-            self._render_game()
+        self._request_game()
 
-    def _poll_buttons(self) -> None:
-        raw_states = self.inputs.read_states()
+    def _poll_buttons(self, now_ns: int) -> None:
+        raw_bits = self.inputs.read_bits()
         if DEBUG:
-            self._debug(f"raw:{raw_states}")
-        # Apply per-button invert
-        back = raw_states.get("back", False)
-        confirm = raw_states.get("confirm", False)
-        push = raw_states.get("push", False)
-        if BACK_INVERT:
-            back = not back
-        if CONFIRM_INVERT:
-            confirm = not confirm
-        if PUSH_INVERT:
-            push = not push
-        # Optionally treat push as confirm
+            self._debug(f"raw:{raw_bits:03b}")
+        self._update_buttons(raw_bits, now_ns)
+
+    def _update_buttons(self, raw_bits: int, now_ns: int) -> None:
+        bits = raw_bits ^ _INVERT_MASK
+        # Optionally treat push as confirm (BIT_PUSH >> 1 == BIT_CONFIRM);
+        # push is not a button of its own
         if USE_PUSH_AS_CONFIRM:
-            confirm = confirm or push
-        now = time.monotonic()
-        for name, pressed in ("back", back), ("confirm", confirm):
-            last_pressed = self._btn_state[name]
-            if pressed != last_pressed:
-                last_change = self._btn_last_change[name]
-                if now - last_change >= DEBOUNCE_SEC:
-                    self._btn_last_change[name] = now
-                    self._btn_state[name] = pressed
-                    if pressed:
-                        self._handle_button(name)
-        # Exit on hold Back+Confirm
-        if self._btn_state["back"] and self._btn_state["confirm"]:
-            hold = getattr(self, "_hold_start", None)
-            if hold is None:
-                self._hold_start = now
-            elif now - hold > 2.0:
-                self.display.draw_text("Exiting...")
-                time.sleep(0.5)
-                self.display.clear()
-                raise SystemExit(0)
-        else:
-            self._hold_start = None  # type: ignore[assignment]
+            bits |= (bits & BIT_PUSH) >> 1
+        bits &= BIT_BACK | BIT_CONFIRM
+        changed = bits ^ self._btn_bits
+        if not changed:
+            return
+        self._btn_bits = bits
+        # State always follows the level so a swallowed bounce can't leave a
+        # button stuck; a press only counts after the button has been released
+        # for DEBOUNCE_SEC
+        changed_at = self._btn_changed_ns
+        # Visit only the bits that changed, lowest (back) first
+        while changed:
+            bit = changed & -changed
+            changed ^= bit
+            i = bit.bit_length() - 1
+            stable_for = now_ns - changed_at[i]
+            changed_at[i] = now_ns
+            if bits & bit and stable_for >= DEBOUNCE_NS:
+                self._handle_button(_BUTTON_NAMES[i])
+        self._update_hold(now_ns)
+
+    def _update_hold(self, now_ns: int) -> None:
+        # Exit on hold Back+Confirm: arm a timer when both go down, cancel it
+        # when either is released; nothing runs per tick while held
+        both = self._btn_bits == BIT_BACK | BIT_CONFIRM
+        if both and self._hold_timer is None:
+            self._hold_start_ns = now_ns
+            self._hold_timer = threading.Timer(
+                EXIT_HOLD_SEC, lambda: self.events.put(HoldExpired(type="hold_expired"))
+            )
+            self._hold_timer.daemon = True
+            self._hold_timer.start()
+        elif not both and self._hold_timer is not None:
+            self._hold_timer.cancel()
+            self._hold_timer = None
+            self._hold_start_ns = None
+
+    def _on_hold_expired(self, event: HoldExpired) -> None:
+        # Ignore an expiry queued by a hold that was released meanwhile
+        start = self._hold_start_ns
+        if start is None or time.monotonic_ns() - start < EXIT_HOLD_NS - 50_000_000:
+            return
+        self._draw_now("Exiting...")
+        time.sleep(0.5)
+        self.display.clear()
+        self._should_exit = True
+
+    def _poll_inputs(self, now_ns: int) -> None:
+        if not self._use_native_encoder:
+            if self.mode == MODE_PROGRESS:
+                # Rotation is ignored while a task runs; skip the GPIO reads
+                self._encoder_paused = True
+            elif self._encoder_paused:
+                # Transitions were missed; restart decoding from the current state
+                self.encoder.resync()
+                self._encoder_paused = False
+            else:
+                # Folded with other detents; applied before the next draw
+                self._pending_delta += self.encoder.read_delta()
+        if not self._use_native_buttons:
+            self._poll_buttons(now_ns)
 
     def _handle_tick(self) -> None:
-        delta = self.encoder.read_delta()
+        self.ticker.consumed()
+        if self.mode == MODE_PROGRESS:
+            # The frame follows wall time, so a late tick skips ahead instead
+            # of slowing the spinner, and an early one draws nothing
+            frame = ((time.monotonic_ns() - self._spinner_start_ns) // SPINNER_TICK_NS) % 12
+            if frame != self.spinner_frame:
+                self.spinner_frame = frame
+                self._request_spinner(self._progress_message, frame)
+        elif self.mode == MODE_INPUT_TEST:
+            self._render_input_test()
+
+    def _on_button(self, event: ButtonEvent) -> None:
+        self._handle_button(event.name)
+
+    def _on_button_edge(self, event: ButtonEdge) -> None:
+        self._debug(f"edge:{event.name}={event.pressed}")
+        bit = BUTTON_BITS[event.name]
+        if event.pressed:
+            self._raw_bits |= bit
+        else:
+            self._raw_bits &= ~bit
+        self._update_buttons(self._raw_bits, time.monotonic_ns())
+
+    def _on_rotate(self, event: Rotate) -> None:
+        self._pending_delta += event.delta
+
+    def _on_tick(self, event: Tick) -> None:
+        self._handle_tick()
+
+    def _on_game_tick(self, event: GameTick) -> None:
+        self.game_ticker.consumed()
+        # Most ticks only advance the game's step counter; draw on a move
+        if self.mode == MODE_GAME_SNAKE and self.game and self.game.update():
+            self._request_game()
+
+    def _on_task_done(self, event: TaskDone) -> None:
+        msg = event.message or ("Done" if event.ok else "Failed")
+        self._draw_now(msg)
+        time.sleep(1.0)
+        # Tasks always run from a menu (progress mode); DockerManager drops
+        # its listing cache itself once a container action completes
+        self._show_menu()
+
+    def _apply_rotation(self) -> None:
+        """Hand accumulated detents to the mode's rotation handler at once."""
+        delta = self._pending_delta
         if delta:
+            self._pending_delta = 0
             self._handle_rotate(delta)
-        self._poll_buttons()
-        if self.mode == "progress":
-            self.spinner_frame = (self.spinner_frame + 1) % 12
-            self.display.draw_spinner(self._progress_message, self.spinner_frame)
-        elif self.mode == "game_snake" and self.game:
-            self.game.update()
-            self._render_game()
-        elif self.mode == "input_test":
-            self._render_input_test()
 
     def run(self) -> None:
-        while True:
+        # Polled inputs are sampled every POLL_INTERVAL_SEC; edge-driven ones
+        # arrive as events, so with both on edges the loop just blocks.
+        polling = not (self._use_native_encoder and self._use_native_buttons)
+        # Bound once: the loop below runs every few milliseconds when polling
+        events_get = self.events.get
+        events_get_nowait = self.events.get_nowait
+        dispatch_get = self._dispatch.get
+        flush = self._flush_display
+        apply_rotation = self._apply_rotation
+        poll = self._poll_inputs
+        monotonic_ns = time.monotonic_ns
+        next_poll_ns = monotonic_ns()
+        while not self._should_exit:
             try:
-                time.sleep(POLL_INTERVAL_SEC)
-                self._handle_tick()
-                while not self.events.empty():
-                    event = self.events.get_nowait()
-                    if isinstance(event, ButtonEvent):
-                        self._handle_button(event.name)
-                    elif isinstance(event, Rotate):
-                        self._handle_rotate(event.delta)
-                    elif isinstance(event, TaskDone):
-                        msg = event.message or ("Done" if event.ok else "Failed")
-                        self.display.draw_text(msg)
-                        time.sleep(1.0)
-                        if self.mode == "docker_list":
-                            self._refresh_docker_list()
-                        else:
-                            self._show_menu()
+                # Draw once per burst of events, right before waiting again
+                apply_rotation()
+                flush()
+                try:
+                    if not polling:
+                        event = events_get()
+                    else:
+                        wait_ns = next_poll_ns - monotonic_ns()
+                        event = events_get(timeout=wait_ns / 1e9) if wait_ns > 0 else events_get_nowait()
+                except Empty:
+                    event = None
+                # Handle whatever else queued up meanwhile before drawing
+                while event is not None:
+                    if self._pending_delta and type(event) is not Rotate:
+                        # Keep order: the cursor moves before anything else
+                        apply_rotation()
+                    handler = dispatch_get(type(event))
+                    if handler is not None:
+                        handler(event)
+                    if self._should_exit:
+                        break
+                    try:
+                        event = events_get_nowait()
+                    except Empty:
+                        event = None
+                if polling:
+                    # One clock read serves the poll deadline and the debounce
+                    now_ns = monotonic_ns()
+                    if now_ns >= next_poll_ns:
+                        # Stay on a fixed grid so handler time doesn't push
+                        # every later poll back; skip periods already missed
+                        next_poll_ns += POLL_INTERVAL_NS
+                        if next_poll_ns <= now_ns:
+                            next_poll_ns = now_ns + POLL_INTERVAL_NS
+                        poll(now_ns)
             except KeyboardInterrupt:
                 break
-            except SystemExit:
-                break
             except Exception as e:
-                self.display.draw_text(f"Error: {str(e)[:20]}")
+                self._draw_now(f"Error: {str(e)[:20]}")
                 time.sleep(1.0)
+        self._cancel_tick()
         self.display.clear()
 
 
@@ -1,3 +1,6 @@
+import functools
+import os
+
 from PIL import ImageFont
 from typing import Optional
 
@@ -11,12 +14,19 @@ _DEFAULT_BOLD_PATHS = [
     "/usr/share/fonts/truetype/freefont/FreeSansBold.ttf",
 ]
 
+# First installed candidate of each list, looked up once at import
+_RESOLVED_REGULAR: Optional[str] = next((p for p in _DEFAULT_FONT_PATHS if os.path.exists(p)), None)
+_RESOLVED_BOLD: Optional[str] = next((p for p in _DEFAULT_BOLD_PATHS if os.path.exists(p)), None)
+
 
+@functools.lru_cache(maxsize=16)
 def get_font(size: int = 11, bold: bool = False) -> ImageFont.ImageFont:
-    paths = _DEFAULT_BOLD_PATHS if bold else _DEFAULT_FONT_PATHS
-    for path in paths:
+    # Shared instances: callers must not mutate them (e.g. set_variation_*);
+    # use font.font_variant() for a private copy
+    path = _RESOLVED_BOLD if bold else _RESOLVED_REGULAR
+    if path is not None:
         try:
             return ImageFont.truetype(path, size)
         except Exception:
-            continue
+            pass
     return ImageFont.load_default()
@@ -4,20 +4,18 @@ from typing import List
 def wrap_text(text: str, max_chars: int = 20) -> List[str]:
     lines: List[str] = []
     for raw_line in text.split("\n"):
+        # split(" ") never returns an empty list, so words[0] always exists
         words = raw_line.split(" ")
-        current: List[str] = []
-        current_len = 0
-        for word in words:
-            if not current:
-                current = [word]
-                current_len = len(word)
-            elif current_len + 1 + len(word) <= max_chars:
-                current.append(word)
-                current_len += 1 + len(word)
+        lens = list(map(len, words))
+        start = 0
+        current_len = lens[0]
+        for i in range(1, len(words)):
+            n = lens[i]
+            if current_len + 1 + n <= max_chars:
+                current_len += 1 + n
             else:
-                lines.append(" ".join(current))
-                current = [word]
-                current_len = len(word)
-        if current:
-            lines.append(" ".join(current))
+                lines.append(" ".join(words[start:i]))
+                start = i
+                current_len = n
+        lines.append(" ".join(words[start:]))
     return lines